@@ -8,10 +8,51 @@ Extracts methodology, theories, concepts, themes, and provides detailed analysis
 import re
 import os
 import sys
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from collections import Counter
 from datetime import datetime
 import json
 
+try:
+    import hyperscan
+except ImportError:  # optional: preferred literal scanner when available
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to one regex per keyword
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the json module for export
+    orjson = None
+
+# Section separator for the printed report
+SEP = '=' * 70
+
+# Analyses run by analyze(); each is independent of the others
+ANALYSES = ('summary', 'keyword_tables', 'components', 'citations', 'keywords')
+
+# Word characters for \b emulation; anything non-ASCII is checked with isalnum()
+_ASCII_WORD_CHARS = frozenset(
+    chr(code) for code in range(128) if chr(code).isalnum() or chr(code) == '_'
+)
+_ASCII_WORD_BYTES = tuple(chr(code) in _ASCII_WORD_CHARS for code in range(128))
+
+# Common words excluded from keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
+    'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both',
+    'few', 'more', 'most', 'other', 'some', 'such', 'than', 'too', 'very'
+})
+
 class SociologyPaperAnalyzer:
     """Main class for analyzing sociology papers."""
 
@@ -110,6 +151,206 @@ class SociologyPaperAnalyzer:
             'future_research': r'(?:future research|further investigation|future studies)'
         }
 
+        # Common citation patterns
+        self.citation_patterns = [
+            r'\([A-Z][a-z]+(?:,?\s+(?:and|&)\s+[A-Z][a-z]+)*,?\s+\d{4}\)',  # (Author, 2020)
+            r'\([A-Z][a-z]+\s+et\s+al\.,?\s+\d{4}\)',  # (Author et al., 2020)
+            r'[A-Z][a-z]+\s+\(\d{4}\)',  # Author (2020)
+        ]
+
+        # Flat keyword table: (category, bucket, keyword) for every tracked term
+        self._keyword_entries = (
+            [('methodology', method_type, keyword)
+             for method_type, keywords in self.methodologies.items()
+             for keyword in keywords]
+            + [('theory', theory_name, keyword)
+               for theory_name, keywords in self.theories.items()
+               for keyword in keywords]
+            + [('concept', concept, concept) for concept in self.concepts]
+        )
+
+        # Whether each keyword starts/ends with a word character, for \b checks
+        self._keyword_edges = [
+            (self._is_word_char(keyword[0]), self._is_word_char(keyword[-1]))
+            for _, _, keyword in self._keyword_entries
+        ]
+
+        # Compile every pattern once so repeated analyses reuse them
+        self._database = None
+        self._automaton = None
+        self._keyword_patterns = None
+        if hyperscan is not None:
+            # Hyperscan matches UTF-8 bytes; encode the keywords once up front
+            self._keyword_bytes = [
+                keyword.encode('utf-8') for _, _, keyword in self._keyword_entries
+            ]
+            self._keyword_byte_lengths = [len(keyword) for keyword in self._keyword_bytes]
+            self._database = self._build_database()
+        elif ahocorasick is not None:
+            self._automaton = self._build_automaton()
+        else:
+            self._keyword_patterns = [
+                self._keyword_pattern(keyword) for _, _, keyword in self._keyword_entries
+            ]
+        self._component_patterns = {
+            component: re.compile(pattern, re.IGNORECASE)
+            for component, pattern in self.research_patterns.items()
+        }
+        self._citation_re = re.compile(
+            '|'.join('(?:' + pattern + ')' for pattern in self.citation_patterns)
+        )
+        self._word_re = re.compile(r'\b[a-z]{4,}\b')
+        self._sentence_re = re.compile(r'[^.!?]+')
+        self._last_scan = None
+
+    @staticmethod
+    def _keyword_pattern(keyword):
+        """Compile a whole-word pattern for a keyword.
+
+        Equivalent to \\b<keyword>\\b, but the keyword comes first so the regex
+        engine can jump between occurrences with its fast literal search; the
+        leading boundary is checked afterwards with a fixed-width lookbehind.
+        """
+        escaped = re.escape(keyword)
+        if SociologyPaperAnalyzer._is_word_char(keyword[0]):
+            leading = r'(?<!\w' + escaped + ')'
+        else:
+            leading = r'(?<=\w' + escaped + ')'
+        return re.compile(escaped + leading + r'\b')
+
+    def _build_database(self):
+        """Compile every keyword into one Hyperscan literal database."""
+        database = hyperscan.Database()
+        database.compile(
+            expressions=self._keyword_bytes,
+            ids=list(range(len(self._keyword_entries))),
+            elements=len(self._keyword_entries),
+            flags=0,
+            literal=True
+        )
+        return database
+
+    def _build_automaton(self):
+        """Build one Aho-Corasick automaton over every keyword."""
+        automaton = ahocorasick.Automaton()
+        indices = {}
+        for index, (_, _, keyword) in enumerate(self._keyword_entries):
+            indices.setdefault(keyword, []).append(index)
+        for keyword, entry_indices in indices.items():
+            starts_word, ends_word = self._keyword_edges[entry_indices[0]]
+            automaton.add_word(
+                keyword, (len(keyword), starts_word, ends_word, tuple(entry_indices))
+            )
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _is_word_char(char):
+        """Match the regex notion of a word character used by \\b."""
+        return char.isalnum() or char == '_'
+
+    @staticmethod
+    def _char_before(data, pos):
+        """Return the UTF-8 character ending at byte offset pos ('' at the start)."""
+        start = pos - 1
+        while start > 0 and 0x80 <= data[start] < 0xC0:
+            start -= 1
+        return data[max(start, 0):pos].decode('utf-8', 'ignore')
+
+    @staticmethod
+    def _char_after(data, pos):
+        """Return the UTF-8 character starting at byte offset pos ('' at the end)."""
+        return data[pos:pos + 4].decode('utf-8', 'ignore')[:1]
+
+    def _scan_hyperscan(self, text_lower):
+        """Count whole-word keyword hits in a single Hyperscan pass."""
+        is_word = self._is_word_char
+        char_before = self._char_before
+        char_after = self._char_after
+        ascii_word = _ASCII_WORD_BYTES
+        edges = self._keyword_edges
+        lengths = self._keyword_byte_lengths
+        counts = [0] * len(self._keyword_entries)
+        last_end = [0] * len(self._keyword_entries)
+        data = text_lower.encode('utf-8', 'ignore')
+        data_length = len(data)
+
+        def on_match(index, _, end, flags, context):
+            start = end - lengths[index]
+            starts_word, ends_word = edges[index]
+            # Emulate \b on both sides; only non-ASCII neighbours need decoding
+            before = data[start - 1] if start > 0 else 0x20
+            if before < 0x80:
+                before_word = ascii_word[before]
+            else:
+                before_word = is_word(char_before(data, start))
+            if before_word == starts_word:
+                return
+            after = data[end] if end < data_length else 0x20
+            if after < 0x80:
+                after_word = ascii_word[after]
+            else:
+                after_word = is_word(char_after(data, end))
+            if after_word == ends_word:
+                return
+            # re.findall never reports overlapping matches of one pattern
+            if start >= last_end[index]:
+                counts[index] += 1
+                last_end[index] = end
+
+        self._database.scan(data, match_event_handler=on_match)
+        return counts
+
+    def _scan(self, text_lower):
+        """Count whole-word keyword hits in a single Aho-Corasick pass."""
+        ascii_word = _ASCII_WORD_CHARS
+        counts = [0] * len(self._keyword_entries)
+        last_end = [0] * len(self._keyword_entries)
+        text_length = len(text_lower)
+
+        for end, (length, starts_word, ends_word, entry_indices) in self._automaton.iter(text_lower):
+            start = end - length + 1
+            # Emulate \b on both sides of the keyword
+            before = text_lower[start - 1] if start > 0 else ' '
+            if (before in ascii_word or (before > '\x7f' and before.isalnum())) == starts_word:
+                continue
+            after = text_lower[end + 1] if end + 1 < text_length else ' '
+            if (after in ascii_word or (after > '\x7f' and after.isalnum())) == ends_word:
+                continue
+            for index in entry_indices:
+                # re.findall never reports overlapping matches of one pattern
+                if start >= last_end[index]:
+                    counts[index] += 1
+                    last_end[index] = end + 1
+
+        return counts
+
+    def _regex_counts(self, text_lower):
+        """Count whole-word keyword hits with one precompiled regex per keyword."""
+        counts = []
+        for (_, _, keyword), pattern in zip(self._keyword_entries, self._keyword_patterns):
+            # A whole-word hit needs a substring hit, so absent keywords skip the regex
+            if keyword not in text_lower:
+                counts.append(0)
+            else:
+                counts.append(sum(1 for _ in pattern.finditer(text_lower)))
+        return counts
+
+    def _keyword_counts(self, text_lower):
+        """Return whole-word hit counts aligned with the flat keyword table."""
+        if self._last_scan is not None and self._last_scan[0] is text_lower:
+            return self._last_scan[1]
+
+        if self._database is not None:
+            counts = self._scan_hyperscan(text_lower)
+        elif self._automaton is not None:
+            counts = self._scan(text_lower)
+        else:
+            counts = self._regex_counts(text_lower)
+
+        self._last_scan = (text_lower, counts)
+        return counts
+
     def read_file(self, filepath):
         """Read text from file (supports .txt and basic text extraction)."""
         try:
@@ -122,64 +363,105 @@ class SociologyPaperAnalyzer:
             print(f"Error reading file: {e}")
             return None
 
-    def detect_methodology(self, text):
-        """Detect research methodology used in the paper."""
-        text_lower = text.lower()
+    def read_file_chunks(self, filepath, size=1 << 20):
+        """Yield the file in chunks of roughly `size` characters, split at line ends.
+
+        No keyword spans a line break, so keyword counts over the chunks add up
+        to the counts over the whole file.
+        """
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            while True:
+                chunk = f.read(size)
+                if not chunk:
+                    break
+                yield chunk + f.readline()
+
+    def scan_file(self, filepath, chunk_size=1 << 20):
+        """Detect methodology, theories and concepts without loading the whole file."""
+        counts = [0] * len(self._keyword_entries)
+        try:
+            for chunk in self.read_file_chunks(filepath, chunk_size):
+                chunk_counts = self._keyword_counts(chunk.lower())
+                counts = [total + count for total, count in zip(counts, chunk_counts)]
+        except FileNotFoundError:
+            print(f"Error: File '{filepath}' not found.")
+            return None
+        except Exception as e:
+            print(f"Error reading file: {e}")
+            return None
+        finally:
+            self._last_scan = None
+
+        return {
+            'methodology': self._methodology_scores(counts),
+            'theories': self._theories_found(counts),
+            'concepts': self._concepts_found(counts)
+        }
+
+    def _methodology_scores(self, counts):
+        """Sum keyword counts per methodology."""
         methodology_scores = {
             'qualitative': 0,
             'quantitative': 0,
             'mixed_methods': 0
         }
 
-        for method_type, keywords in self.methodologies.items():
-            for keyword in keywords:
-                methodology_scores[method_type] += len(re.findall(
-                    r'\b' + re.escape(keyword) + r'\b',
-                    text_lower
-                ))
+        for (category, method_type, _), count in zip(self._keyword_entries, counts):
+            if category == 'methodology':
+                methodology_scores[method_type] += count
 
         return methodology_scores
 
-    def identify_theories(self, text):
-        """Identify sociological theories mentioned in the paper."""
-        text_lower = text.lower()
+    def _theories_found(self, counts):
+        """Group keyword counts into the theories they indicate."""
         theories_found = {}
 
-        for theory_name, keywords in self.theories.items():
-            count = 0
-            matched_terms = []
-            for keyword in keywords:
-                matches = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower))
-                if matches > 0:
-                    count += matches
-                    matched_terms.append(keyword)
-
-            if count > 0:
-                theories_found[theory_name] = {
-                    'count': count,
-                    'terms': list(set(matched_terms))
-                }
+        for (category, theory_name, keyword), matches in zip(self._keyword_entries, counts):
+            if category == 'theory' and matches > 0:
+                theory = theories_found.setdefault(theory_name, {'count': 0, 'terms': []})
+                theory['count'] += matches
+                # Keep terms in table order; guard against repeated keywords
+                if keyword not in theory['terms']:
+                    theory['terms'].append(keyword)
 
         return theories_found
 
-    def extract_concepts(self, text):
-        """Extract key sociological concepts from the paper."""
-        text_lower = text.lower()
+    def _concepts_found(self, counts, top_n=None):
+        """Collect concepts with at least one mention, most frequent first."""
         concepts_found = {}
 
-        for concept in self.concepts:
-            count = len(re.findall(r'\b' + re.escape(concept) + r'\b', text_lower))
-            if count > 0:
+        for (category, concept, _), count in zip(self._keyword_entries, counts):
+            if category == 'concept' and count > 0:
                 concepts_found[concept] = count
 
+        if top_n is not None:
+            return dict(heapq.nlargest(top_n, concepts_found.items(), key=lambda x: x[1]))
         return dict(sorted(concepts_found.items(), key=lambda x: x[1], reverse=True))
 
+    def detect_methodology(self, text, text_lower=None):
+        """Detect research methodology used in the paper."""
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._methodology_scores(self._keyword_counts(text_lower))
+
+    def identify_theories(self, text, text_lower=None):
+        """Identify sociological theories mentioned in the paper."""
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._theories_found(self._keyword_counts(text_lower))
+
+    def extract_concepts(self, text, text_lower=None, top_n=None):
+        """Extract key sociological concepts from the paper (optionally only the top_n)."""
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._concepts_found(self._keyword_counts(text_lower), top_n)
+
     def analyze_research_components(self, text):
         """Analyze research components like hypotheses, research questions, etc."""
         components = {}
 
-        for component, pattern in self.research_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for component, pattern in self._component_patterns.items():
+            matches = pattern.finditer(text)
             count = sum(1 for _ in matches)
             if count > 0:
                 components[component] = count
@@ -188,65 +470,77 @@ class SociologyPaperAnalyzer:
 
     def extract_citations(self, text):
         """Extract and count citations in the paper."""
-        # Common citation patterns
-        patterns = [
-            r'\([A-Z][a-z]+(?:,?\s+(?:and|&)\s+[A-Z][a-z]+)*,?\s+\d{4}\)',  # (Author, 2020)
-            r'\([A-Z][a-z]+\s+et\s+al\.,?\s+\d{4}\)',  # (Author et al., 2020)
-            r'[A-Z][a-z]+\s+\(\d{4}\)',  # Author (2020)
-        ]
-
-        all_citations = []
-        for pattern in patterns:
-            citations = re.findall(pattern, text)
-            all_citations.extend(citations)
+        all_citations = self._citation_re.findall(text)
+        # One order-preserving dedup serves both the unique count and the sample
+        unique_citations = dict.fromkeys(all_citations)
 
         return {
             'total_citations': len(all_citations),
-            'unique_citations': len(set(all_citations)),
-            'sample_citations': list(set(all_citations))[:10]
+            'unique_citations': len(unique_citations),
+            'sample_citations': list(islice(unique_citations, 10))
         }
 
-    def extract_keywords(self, text, top_n=20):
+    def extract_keywords(self, text, top_n=20, text_lower=None):
         """Extract top keywords from the paper."""
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
-            'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
-            'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'both',
-            'few', 'more', 'most', 'other', 'some', 'such', 'than', 'too', 'very'
-        }
-
-        # Extract words
-        words = re.findall(r'\b[a-z]{4,}\b', text.lower())
-        words = [w for w in words if w not in stop_words]
+        if text_lower is None:
+            text_lower = text.lower()
 
-        # Count frequencies
-        word_freq = Counter(words)
+        # Count every word in C, then drop the few common words afterwards
+        word_freq = Counter(self._word_re.findall(text_lower))
+        for word in STOP_WORDS:
+            word_freq.pop(word, None)
 
         return word_freq.most_common(top_n)
 
     def generate_summary(self, text):
         """Generate a summary of the paper's characteristics."""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        word_count = len(text.split())
+        # Only sentences longer than 20 characters count; no list of them is kept
+        sentence_count = sum(
+            1 for match in self._sentence_re.finditer(text)
+            if len(match.group().strip()) > 20
+        )
 
         return {
-            'word_count': len(text.split()),
-            'sentence_count': len(sentences),
-            'avg_sentence_length': len(text.split()) / max(len(sentences), 1),
-            'paragraph_count': len(text.split('\n\n'))
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'avg_sentence_length': word_count / max(sentence_count, 1),
+            'paragraph_count': text.count('\n\n') + 1
         }
 
-    def analyze(self, filepath):
-        """Perform comprehensive analysis of a sociology paper."""
-        print(f"\n{'='*70}")
-        print(f"SOCIOLOGY PAPER ANALYZER")
-        print(f"{'='*70}\n")
-        print(f"Analyzing: {filepath}")
-        print(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    def _run_analysis(self, name, text, text_lower):
+        """Run one of the independent analyses listed in ANALYSES."""
+        if name == 'summary':
+            return self.generate_summary(text)
+        if name == 'keyword_tables':
+            # These three share a single keyword scan, so they run together
+            return (
+                self.detect_methodology(text, text_lower),
+                self.identify_theories(text, text_lower),
+                self.extract_concepts(text, text_lower)
+            )
+        if name == 'components':
+            return self.analyze_research_components(text)
+        if name == 'citations':
+            return self.extract_citations(text)
+        return self.extract_keywords(text, top_n=15, text_lower=text_lower)
+
+    def analyze(self, filepath, jobs=1):
+        """Perform comprehensive analysis of a sociology paper.
+
+        With jobs > 1 the independent analyses run in that many worker processes.
+        """
+        now = datetime.now()
+        # Collect report lines and write them in one go instead of one print per line
+        out = []
+        out.append(f"\n{SEP}")
+        out.append(f"SOCIOLOGY PAPER ANALYZER")
+        out.append(f"{SEP}\n")
+        out.append(f"Analyzing: {filepath}")
+        out.append(f"Analysis Date: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        # Emit the header before reading so read errors still appear below it
+        sys.stdout.write('\n'.join(out) + '\n')
+        out = []
 
         # Read the file
         text = self.read_file(filepath)
@@ -254,90 +548,102 @@ class SociologyPaperAnalyzer:
             return None
 
         # Perform analyses
-        print(f"{'='*70}")
-        print("1. DOCUMENT STATISTICS")
-        print(f"{'='*70}")
-        summary = self.generate_summary(text)
-        print(f"Word Count: {summary['word_count']:,}")
-        print(f"Sentence Count: {summary['sentence_count']:,}")
-        print(f"Average Sentence Length: {summary['avg_sentence_length']:.1f} words")
-        print(f"Paragraph Count: {summary['paragraph_count']:,}")
-
-        print(f"\n{'='*70}")
-        print("2. RESEARCH METHODOLOGY")
-        print(f"{'='*70}")
-        methodology = self.detect_methodology(text)
+        if jobs > 1:
+            workers = min(jobs, len(ANALYSES))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(text,)) as executor:
+                futures = {name: executor.submit(_run_in_worker, name) for name in ANALYSES}
+                sections = {name: future.result() for name, future in futures.items()}
+        else:
+            text_lower = text.lower()
+            sections = {name: self._run_analysis(name, text, text_lower) for name in ANALYSES}
+        # Drop the cached scan so the lowercased copy is not kept after analysis
+        self._last_scan = None
+
+        summary = sections['summary']
+        methodology, theories, concepts = sections['keyword_tables']
+        components = sections['components']
+        citations = sections['citations']
+        keywords = sections['keywords']
+
+        out.append(f"{SEP}")
+        out.append("1. DOCUMENT STATISTICS")
+        out.append(f"{SEP}")
+        out.append(f"Word Count: {summary['word_count']:,}")
+        out.append(f"Sentence Count: {summary['sentence_count']:,}")
+        out.append(f"Average Sentence Length: {summary['avg_sentence_length']:.1f} words")
+        out.append(f"Paragraph Count: {summary['paragraph_count']:,}")
+
+        out.append(f"\n{SEP}")
+        out.append("2. RESEARCH METHODOLOGY")
+        out.append(f"{SEP}")
         total_method_mentions = sum(methodology.values())
         if total_method_mentions > 0:
             for method, count in sorted(methodology.items(), key=lambda x: x[1], reverse=True):
                 percentage = (count / total_method_mentions) * 100
-                print(f"{method.replace('_', ' ').title()}: {count} mentions ({percentage:.1f}%)")
+                out.append(f"{method.replace('_', ' ').title()}: {count} mentions ({percentage:.1f}%)")
 
             # Determine primary methodology
             primary = max(methodology.items(), key=lambda x: x[1])
             if primary[1] > 0:
-                print(f"\nPrimary Methodology: {primary[0].replace('_', ' ').title()}")
+                out.append(f"\nPrimary Methodology: {primary[0].replace('_', ' ').title()}")
         else:
-            print("No clear methodology indicators found.")
+            out.append("No clear methodology indicators found.")
 
-        print(f"\n{'='*70}")
-        print("3. SOCIOLOGICAL THEORIES")
-        print(f"{'='*70}")
-        theories = self.identify_theories(text)
+        out.append(f"\n{SEP}")
+        out.append("3. SOCIOLOGICAL THEORIES")
+        out.append(f"{SEP}")
         if theories:
             for theory, data in sorted(theories.items(), key=lambda x: x[1]['count'], reverse=True):
-                print(f"\n{theory.replace('_', ' ').title()}:")
-                print(f"  Mentions: {data['count']}")
-                print(f"  Related terms: {', '.join(data['terms'][:5])}")
+                out.append(f"\n{theory.replace('_', ' ').title()}:")
+                out.append(f"  Mentions: {data['count']}")
+                out.append(f"  Related terms: {', '.join(data['terms'][:5])}")
         else:
-            print("No major sociological theories explicitly identified.")
+            out.append("No major sociological theories explicitly identified.")
 
-        print(f"\n{'='*70}")
-        print("4. KEY SOCIOLOGICAL CONCEPTS")
-        print(f"{'='*70}")
-        concepts = self.extract_concepts(text)
+        out.append(f"\n{SEP}")
+        out.append("4. KEY SOCIOLOGICAL CONCEPTS")
+        out.append(f"{SEP}")
         if concepts:
-            for i, (concept, count) in enumerate(list(concepts.items())[:15], 1):
-                print(f"{i}. {concept.title()}: {count} mentions")
+            for i, (concept, count) in enumerate(islice(concepts.items(), 15), 1):
+                out.append(f"{i}. {concept.title()}: {count} mentions")
         else:
-            print("No standard sociological concepts identified.")
+            out.append("No standard sociological concepts identified.")
 
-        print(f"\n{'='*70}")
-        print("5. RESEARCH COMPONENTS")
-        print(f"{'='*70}")
-        components = self.analyze_research_components(text)
+        out.append(f"\n{SEP}")
+        out.append("5. RESEARCH COMPONENTS")
+        out.append(f"{SEP}")
         if components:
             for component, count in components.items():
-                print(f"{component.replace('_', ' ').title()}: {count} mentions")
+                out.append(f"{component.replace('_', ' ').title()}: {count} mentions")
         else:
-            print("No clear research components identified.")
-
-        print(f"\n{'='*70}")
-        print("6. CITATION ANALYSIS")
-        print(f"{'='*70}")
-        citations = self.extract_citations(text)
-        print(f"Total Citations Found: {citations['total_citations']}")
-        print(f"Unique Citations: {citations['unique_citations']}")
+            out.append("No clear research components identified.")
+
+        out.append(f"\n{SEP}")
+        out.append("6. CITATION ANALYSIS")
+        out.append(f"{SEP}")
+        out.append(f"Total Citations Found: {citations['total_citations']}")
+        out.append(f"Unique Citations: {citations['unique_citations']}")
         if citations['sample_citations']:
-            print(f"\nSample Citations:")
+            out.append(f"\nSample Citations:")
             for cite in citations['sample_citations'][:5]:
-                print(f"  - {cite}")
+                out.append(f"  - {cite}")
 
-        print(f"\n{'='*70}")
-        print("7. TOP KEYWORDS")
-        print(f"{'='*70}")
-        keywords = self.extract_keywords(text, top_n=15)
+        out.append(f"\n{SEP}")
+        out.append("7. TOP KEYWORDS")
+        out.append(f"{SEP}")
         for i, (word, count) in enumerate(keywords, 1):
-            print(f"{i}. {word}: {count} occurrences")
+            out.append(f"{i}. {word}: {count} occurrences")
 
-        print(f"\n{'='*70}")
-        print("ANALYSIS COMPLETE")
-        print(f"{'='*70}\n")
+        out.append(f"\n{SEP}")
+        out.append("ANALYSIS COMPLETE")
+        out.append(f"{SEP}\n")
+        sys.stdout.write('\n'.join(out) + '\n')
 
         # Return structured results
         return {
             'filepath': filepath,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'summary': summary,
             'methodology': methodology,
             'theories': theories,
@@ -351,8 +657,12 @@ class SociologyPaperAnalyzer:
         """Export analysis results to a JSON file."""
         if results:
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    with open(output_file, 'wb') as f:
+                        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        json.dump(results, f, indent=2, ensure_ascii=False)
                 print(f"Results exported to: {output_file}")
                 return True
             except Exception as e:
@@ -361,13 +671,29 @@ class SociologyPaperAnalyzer:
         return False
 
 
+_worker_state = None
+
+
+def _init_worker(text):
+    """Give each worker process its own analyzer and copy of the paper."""
+    global _worker_state
+    _worker_state = (SociologyPaperAnalyzer(), text, text.lower())
+
+
+def _run_in_worker(name):
+    """Run one named analysis inside a worker process."""
+    analyzer, text, text_lower = _worker_state
+    return analyzer._run_analysis(name, text, text_lower)
+
+
 def main():
     """Main function to run the analyzer."""
     if len(sys.argv) < 2:
-        print("Usage: python sociology_paper_analyzer.py <file_path> [--export output.json]")
+        print("Usage: python sociology_paper_analyzer.py <file_path> [--export output.json] [--jobs N]")
         print("\nExample:")
         print("  python sociology_paper_analyzer.py paper.txt")
         print("  python sociology_paper_analyzer.py paper.txt --export analysis.json")
+        print("  python sociology_paper_analyzer.py paper.txt --jobs 4")
         sys.exit(1)
 
     filepath = sys.argv[1]
@@ -379,9 +705,20 @@ def main():
         if len(sys.argv) > export_index + 1:
             export_file = sys.argv[export_index + 1]
 
+    # Check for parallel jobs flag
+    jobs = 1
+    if '--jobs' in sys.argv:
+        jobs_index = sys.argv.index('--jobs')
+        if len(sys.argv) > jobs_index + 1:
+            try:
+                jobs = int(sys.argv[jobs_index + 1])
+            except ValueError:
+                print(f"Error: --jobs expects a number, got '{sys.argv[jobs_index + 1]}'")
+                sys.exit(1)
+
     # Create analyzer and run analysis
     analyzer = SociologyPaperAnalyzer()
-    results = analyzer.analyze(filepath)
+    results = analyzer.analyze(filepath, jobs=jobs)
 
     # Export if requested
     if export_file and results: